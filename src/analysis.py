@@ -1,12 +1,13 @@
 """OLS regression with HAC standard errors."""
 
-import json
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
+from scipy.linalg import lstsq
+
+from .json_io import dump_json
 
 
 @dataclass
@@ -23,6 +24,61 @@ class RegressionResult:
     maxlags: int
 
 
+def _newey_west_meat(u: np.ndarray, maxlags: int) -> np.ndarray:
+    """Newey-West long-run covariance of the scores u (n x p).
+
+    Uses Bartlett weights and no small-sample correction, matching
+    statsmodels' cov_type="HAC" defaults.
+    """
+    n = u.shape[0]
+    meat = u.T @ u
+    for lag in range(1, min(maxlags, n - 1) + 1):
+        # gamma[i, j] = sum_t u[t + lag, i] * u[t, j]
+        gamma = u[lag:].T @ u[:-lag]
+        meat += (1.0 - lag / (maxlags + 1)) * (gamma + gamma.T)
+    return meat
+
+
+def _prepare_design(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Build the [1, x] design matrix and its inverse moment matrix.
+
+    Both only depend on x, so they can be shared across regressions
+    with different dependent variables.
+    """
+    x = np.asarray(x, dtype=float)
+    X = np.column_stack([np.ones_like(x), x])
+    XtX_inv = np.linalg.inv(X.T @ X)
+    return X, XtX_inv
+
+
+def _fit_given_design(
+    X: np.ndarray,
+    XtX_inv: np.ndarray,
+    Y: np.ndarray,
+    maxlags: int,
+) -> list[tuple[float, float, float, float, float]]:
+    """Fit OLS with HAC t-statistics for each column of Y on a shared design.
+
+    Returns:
+        One (intercept, slope, t_hac, r2, correlation) tuple per column of Y
+    """
+    beta = lstsq(X, Y, lapack_driver="gelsy", check_finite=False)[0]
+    resid = Y - X @ beta
+    Y_dev = Y - Y.mean(axis=0)
+    r2 = 1.0 - (resid * resid).sum(axis=0) / (Y_dev * Y_dev).sum(axis=0)
+    # With a single regressor plus intercept, corr(x, y) = sign(slope) * sqrt(R^2)
+    corr = np.sign(beta[1]) * np.sqrt(np.maximum(r2, 0.0))
+
+    fits = []
+    for k in range(Y.shape[1]):
+        meat = _newey_west_meat(X * resid[:, k, None], maxlags)
+        cov_hac = XtX_inv @ meat @ XtX_inv
+        intercept, slope = beta[:, k]
+        t_hac = slope / np.sqrt(cov_hac[1, 1])
+        fits.append((intercept, slope, t_hac, r2[k], corr[k]))
+    return fits
+
+
 def fit_ols_hac(
     x: np.ndarray,
     y: np.ndarray,
@@ -40,17 +96,9 @@ def fit_ols_hac(
     Returns:
         RegressionResult with OLS coefficients and HAC t-statistic
     """
-    x = np.asarray(x, dtype=float)
-    y = np.asarray(y, dtype=float)
-
-    X = sm.add_constant(x)
-    ols = sm.OLS(y, X).fit()
-    hac = sm.OLS(y, X).fit(cov_type="HAC", cov_kwds={"maxlags": maxlags})
-
-    intercept, slope = ols.params
-    t_hac = hac.tvalues[1]
-    r2 = ols.rsquared
-    corr = np.corrcoef(x, y)[0, 1]
+    X, XtX_inv = _prepare_design(x)
+    Y = np.asarray(y, dtype=float).reshape(-1, 1)
+    intercept, slope, t_hac, r2, corr = _fit_given_design(X, XtX_inv, Y, maxlags)[0]
 
     return RegressionResult(
         dependent_var=dependent_var,
@@ -59,7 +107,7 @@ def fit_ols_hac(
         t_hac=t_hac,
         r2=r2,
         correlation=corr,
-        n_obs=len(x),
+        n_obs=len(X),
         maxlags=maxlags,
     )
 
@@ -70,6 +118,9 @@ def run_regressions(
 ) -> dict[str, RegressionResult]:
     """Run regressions for profit share and wage share.
 
+    Both regressions share the productivity regressor, so the design matrix
+    is factorized once and both dependent variables are solved together.
+
     Args:
         df: DataFrame with prod_yoy_pct, d_profit_share_yoy_pp, d_wage_share_yoy_pp
         maxlags: Maximum lags for HAC estimation
@@ -77,23 +128,30 @@ def run_regressions(
     Returns:
         Dictionary with 'profit' and 'wage' RegressionResults
     """
-    x = df["prod_yoy_pct"].values
-
-    profit_result = fit_ols_hac(
-        x,
-        df["d_profit_share_yoy_pp"].values,
-        maxlags=maxlags,
-        dependent_var="d_profit_share_yoy_pp",
-    )
-
-    wage_result = fit_ols_hac(
-        x,
-        df["d_wage_share_yoy_pp"].values,
-        maxlags=maxlags,
-        dependent_var="d_wage_share_yoy_pp",
-    )
-
-    return {"profit": profit_result, "wage": wage_result}
+    dependent_vars = {
+        "profit": "d_profit_share_yoy_pp",
+        "wage": "d_wage_share_yoy_pp",
+    }
+
+    X, XtX_inv = _prepare_design(df["prod_yoy_pct"].values)
+    Y = df[list(dependent_vars.values())].to_numpy(dtype=float)
+    fits = _fit_given_design(X, XtX_inv, Y, maxlags)
+
+    results = {}
+    for (name, var), (intercept, slope, t_hac, r2, corr) in zip(
+        dependent_vars.items(), fits
+    ):
+        results[name] = RegressionResult(
+            dependent_var=var,
+            intercept=intercept,
+            slope=slope,
+            t_hac=t_hac,
+            r2=r2,
+            correlation=corr,
+            n_obs=len(X),
+            maxlags=maxlags,
+        )
+    return results
 
 
 def export_results(
@@ -114,8 +172,7 @@ def export_results(
 
     results_dict = {k: asdict(v) for k, v in results.items()}
     json_path = output_path / "regression_summary.json"
-    with open(json_path, "w") as f:
-        json.dump(results_dict, f, indent=2)
+    dump_json(results_dict, json_path)
 
     rows = []
     for name, result in results.items():
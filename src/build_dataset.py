@@ -1,5 +1,6 @@
 """Build the analysis dataset from raw FRED series."""
 
+import functools
 from pathlib import Path
 
 import numpy as np
@@ -17,14 +18,20 @@ def merge_series(series_data: dict[str, pd.DataFrame]) -> pd.DataFrame:
     Returns:
         Merged DataFrame with date as index
     """
-    dfs = list(series_data.values())
-    merged = dfs[0]
-    for df in dfs[1:]:
-        merged = merged.merge(df, on="date", how="outer")
-    merged = merged.sort_values("date").reset_index(drop=True)
+    frames = [
+        df.set_index("date")[[series_id]] for series_id, df in series_data.items()
+    ]
+    merged = pd.concat(frames, axis=1, join="outer", sort=True).reset_index()
     return merged
 
 
+def _lag_diff(values: np.ndarray, periods: int = 4) -> np.ndarray:
+    """Return values[t] - values[t - periods], with NaN for the first rows."""
+    out = np.full_like(values, np.nan)
+    out[periods:] = values[periods:] - values[:-periods]
+    return out
+
+
 def compute_transformations(df: pd.DataFrame) -> pd.DataFrame:
     """Compute productivity growth and factor share transformations.
 
@@ -39,60 +46,82 @@ def compute_transformations(df: pd.DataFrame) -> pd.DataFrame:
         df: DataFrame with OPHNFB, GDP, CPROFIT, COE columns
 
     Returns:
-        DataFrame with computed transformations
+        New DataFrame with the input columns plus the transformations;
+        the input frame is not modified
     """
-    result = df.copy()
+    gdp = df["GDP"].to_numpy()
+    profit_share = 100 * df["CPROFIT"].to_numpy() / gdp
+    wage_share = 100 * df["COE"].to_numpy() / gdp
+
+    new_cols = {
+        "prod_yoy_pct": 100 * _lag_diff(np.log(df["OPHNFB"].to_numpy())),
+        "profit_share_pct": profit_share,
+        "wage_share_pct": wage_share,
+        "d_profit_share_yoy_pp": _lag_diff(profit_share),
+        "d_wage_share_yoy_pp": _lag_diff(wage_share),
+    }
+    return df.assign(**new_cols)
+
+
+def _build_analysis_dataset(
+    no_network: bool,
+    cache_dir: str,
+    force_refresh: bool = False,
+) -> pd.DataFrame:
+    """Fetch, merge and transform the series into the analysis dataset."""
+    client = FREDClient(cache_dir=cache_dir, no_network=no_network)
+    series_data = client.get_all_series(force_refresh=force_refresh)
 
-    result["prod_yoy_pct"] = 100 * (
-        np.log(result["OPHNFB"]) - np.log(result["OPHNFB"].shift(4))
-    )
+    for series_id, df in series_data.items():
+        client.validate_series(df, series_id)
+
+    merged = merge_series(series_data)
+    transformed = compute_transformations(merged)
 
-    result["profit_share_pct"] = 100 * result["CPROFIT"] / result["GDP"]
-    result["wage_share_pct"] = 100 * result["COE"] / result["GDP"]
+    output_cols = [
+        "date",
+        "prod_yoy_pct",
+        "d_wage_share_yoy_pp",
+        "wage_share_pct",
+        "d_profit_share_yoy_pp",
+        "profit_share_pct",
+    ]
+    return transformed[output_cols].dropna().reset_index(drop=True)
 
-    result["d_profit_share_yoy_pp"] = (
-        result["profit_share_pct"] - result["profit_share_pct"].shift(4)
-    )
-    result["d_wage_share_yoy_pp"] = (
-        result["wage_share_pct"] - result["wage_share_pct"].shift(4)
-    )
 
-    return result
+_cached_build_analysis_dataset = functools.lru_cache(maxsize=4)(_build_analysis_dataset)
 
 
 def build_analysis_dataset(
     no_network: bool = False,
     cache_dir: str = "data/raw",
     output_dir: str = "data/processed",
+    force_refresh: bool = False,
 ) -> pd.DataFrame:
     """Build the complete analysis dataset.
 
+    Results are memoized per (no_network, cache_dir), so repeated
+    calls in one process skip the cache reads and transformations. The
+    processed CSV is still written on every call, and each call returns a
+    fresh copy that is safe to mutate.
+
     Args:
         no_network: If True, use only cached data
         cache_dir: Directory for raw FRED data cache
         output_dir: Directory for processed output
+        force_refresh: If True, refetch all series and rebuild, discarding
+            memoized datasets
 
     Returns:
         DataFrame ready for analysis
     """
-    client = FREDClient(cache_dir=cache_dir, no_network=no_network)
-    series_data = client.get_all_series()
-
-    for series_id, df in series_data.items():
-        client.validate_series(df, series_id)
-
-    merged = merge_series(series_data)
-    transformed = compute_transformations(merged)
-
-    output_cols = [
-        "date",
-        "prod_yoy_pct",
-        "d_wage_share_yoy_pp",
-        "wage_share_pct",
-        "d_profit_share_yoy_pp",
-        "profit_share_pct",
-    ]
-    analysis_df = transformed[output_cols].dropna().reset_index(drop=True)
+    if force_refresh:
+        _cached_build_analysis_dataset.cache_clear()
+        analysis_df = _build_analysis_dataset(
+            no_network, cache_dir, force_refresh=True
+        )
+    else:
+        analysis_df = _cached_build_analysis_dataset(no_network, cache_dir).copy()
 
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
@@ -16,6 +16,7 @@ def run_all(
     output_dir: str = "data/processed",
     figures_dir: str = "figures",
     results_dir: str = "results",
+    incremental: bool = False,
 ) -> None:
     """Run the complete analysis pipeline.
 
@@ -25,6 +26,7 @@ def run_all(
         output_dir: Directory for processed data output
         figures_dir: Directory for figure outputs
         results_dir: Directory for regression results
+        incremental: If True, skip rewriting unchanged stationarity results
     """
     print("Building analysis dataset...")
     df = build_analysis_dataset(
@@ -42,9 +44,12 @@ def run_all(
         print(f"  {var}: ADF p={result.adf_pvalue:.4f}, KPSS p={result.kpss_pvalue:.4f} -> {status}")
 
     print("\nExporting stationarity results...")
-    stat_json_path, stat_csv_path = export_stationarity_results(stationarity_results, output_dir=results_dir)
+    stat_json_path, stat_csv_path, stat_parquet_path = export_stationarity_results(
+        stationarity_results, output_dir=results_dir, force=not incremental
+    )
     print(f"  JSON: {stat_json_path}")
     print(f"  CSV: {stat_csv_path}")
+    print(f"  Parquet: {stat_parquet_path}")
 
     print("\nRunning regressions...")
     results = run_regressions(df, maxlags=4)
@@ -107,6 +112,11 @@ def main() -> int:
         default="results",
         help="Directory for regression results (default: results)",
     )
+    run_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip rewriting stationarity results that are unchanged",
+    )
 
     args = parser.parse_args()
 
@@ -121,6 +131,7 @@ def main() -> int:
             output_dir=args.output_dir,
             figures_dir=args.figures_dir,
             results_dir=args.results_dir,
+            incremental=args.incremental,
         )
         return 0
 
@@ -1,16 +1,21 @@
 """FRED API client with caching support."""
 
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 import requests
 from dotenv import load_dotenv
 
+from .json_io import dump_json, load_json
+
 load_dotenv()
 
 FRED_BASE_URL = "https://api.stlouisfed.org/fred"
+_NS_PER_DAY = 86_400 * 10**9
 SERIES_IDS = {
     "OPHNFB": "Output Per Hour of All Persons, Nonfarm Business Sector",
     "GDP": "Gross Domestic Product",
@@ -30,14 +35,23 @@ class FREDClient:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.no_network = no_network
         self.metadata_path = self.cache_dir / "series_metadata.json"
+        self._session = requests.Session()
+        self._metadata_cache: Optional[dict] = None
 
     def _get_cache_path(self, series_id: str) -> Path:
         """Get cache file path for a series."""
+        return self.cache_dir / f"{series_id}.parquet"
+
+    def _get_csv_cache_path(self, series_id: str) -> Path:
+        """Get the CSV copy of the cache for a series (the tracked data)."""
         return self.cache_dir / f"{series_id}.csv"
 
     def _is_cached(self, series_id: str) -> bool:
         """Check if series data is cached."""
-        return self._get_cache_path(series_id).exists()
+        return (
+            self._get_cache_path(series_id).exists()
+            or self._get_csv_cache_path(series_id).exists()
+        )
 
     def _fetch_series_from_api(self, series_id: str) -> pd.DataFrame:
         """Fetch series data from FRED API."""
@@ -47,16 +61,19 @@ class FREDClient:
             "api_key": self.api_key,
             "file_type": "json",
         }
-        response = requests.get(url, params=params, timeout=30)
+        response = self._session.get(url, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
 
         observations = data.get("observations", [])
-        df = pd.DataFrame(observations)
-        df = df[["date", "value"]].copy()
-        df["date"] = pd.to_datetime(df["date"])
-        df["value"] = pd.to_numeric(df["value"], errors="coerce")
-        df = df.rename(columns={"value": series_id})
+        dates = [obs["date"] for obs in observations]
+        values = [obs["value"] for obs in observations]
+        df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(dates),
+                series_id: pd.to_numeric(values, errors="coerce"),
+            }
+        )
         return df
 
     def _fetch_metadata_from_api(self, series_id: str) -> dict:
@@ -67,34 +84,56 @@ class FREDClient:
             "api_key": self.api_key,
             "file_type": "json",
         }
-        response = requests.get(url, params=params, timeout=30)
+        response = self._session.get(url, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
         return data.get("seriess", [{}])[0]
 
     def _load_from_cache(self, series_id: str) -> pd.DataFrame:
-        """Load series data from cache."""
+        """Load series data from cache.
+
+        The Parquet copy is read when it is at least as new as the CSV;
+        otherwise (first load, or the CSV was updated, e.g. by a pull) it is
+        rebuilt from the CSV.
+        """
         cache_path = self._get_cache_path(series_id)
-        df = pd.read_csv(cache_path)
-        df["date"] = pd.to_datetime(df["date"])
+        csv_path = self._get_csv_cache_path(series_id)
+        if cache_path.exists() and (
+            not csv_path.exists()
+            or csv_path.stat().st_mtime <= cache_path.stat().st_mtime
+        ):
+            return pd.read_parquet(cache_path)
+
+        df = pd.read_csv(
+            csv_path,
+            parse_dates=["date"],
+            dtype={series_id: "float64"},
+        )
+        df.to_parquet(cache_path, index=False)
         return df
 
     def _save_to_cache(self, series_id: str, df: pd.DataFrame) -> None:
-        """Save series data to cache."""
-        cache_path = self._get_cache_path(series_id)
-        df.to_csv(cache_path, index=False)
+        """Save series data to cache.
+
+        The CSV is the copy kept in version control, so it is rewritten
+        alongside the Parquet file that is read back.
+        """
+        df.to_csv(self._get_csv_cache_path(series_id), index=False)
+        df.to_parquet(self._get_cache_path(series_id), index=False)
 
     def _load_metadata(self) -> dict:
-        """Load metadata from cache."""
-        if self.metadata_path.exists():
-            with open(self.metadata_path, "r") as f:
-                return json.load(f)
-        return {}
+        """Load metadata from cache, reading the file at most once."""
+        if self._metadata_cache is None:
+            if self.metadata_path.exists():
+                self._metadata_cache = load_json(self.metadata_path)
+            else:
+                self._metadata_cache = {}
+        return self._metadata_cache
 
     def _save_metadata(self, metadata: dict) -> None:
         """Save metadata to cache."""
-        with open(self.metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        dump_json(metadata, self.metadata_path)
+        self._metadata_cache = metadata
 
     def get_series(self, series_id: str, force_refresh: bool = False) -> pd.DataFrame:
         """Get series data, using cache if available.
@@ -138,12 +177,18 @@ class FREDClient:
     def get_all_series(self, force_refresh: bool = False) -> dict[str, pd.DataFrame]:
         """Fetch all required series.
 
+        Series are fetched concurrently; requests share one HTTP session so
+        the connection to FRED is reused.
+
         Returns:
             Dictionary mapping series ID to DataFrame
         """
-        series_data = {}
-        for series_id in SERIES_IDS:
-            series_data[series_id] = self.get_series(series_id, force_refresh)
+        with ThreadPoolExecutor(max_workers=len(SERIES_IDS)) as executor:
+            frames = executor.map(
+                lambda series_id: self.get_series(series_id, force_refresh),
+                SERIES_IDS,
+            )
+            series_data = dict(zip(SERIES_IDS, frames))
         return series_data
 
     def validate_series(self, df: pd.DataFrame, series_id: str) -> None:
@@ -158,9 +203,10 @@ class FREDClient:
         if df[series_id].isna().all():
             raise ValueError(f"Series {series_id} has all missing values")
 
-        date_diff = df["date"].diff().dropna()
-        if not date_diff.empty:
-            median_diff = date_diff.median()
-            expected_quarterly = pd.Timedelta(days=91)
-            if abs(median_diff - expected_quarterly) > pd.Timedelta(days=10):
+        dates = df["date"].to_numpy(dtype="datetime64[ns]")
+        dates = dates[~np.isnat(dates)]
+        if dates.size >= 2:
+            median_diff_ns = np.median(np.diff(dates.view("i8")))
+            expected_quarterly_ns = 91 * _NS_PER_DAY
+            if abs(median_diff_ns - expected_quarterly_ns) > 10 * _NS_PER_DAY:
                 print(f"Warning: {series_id} may not be quarterly frequency")
@@ -0,0 +1,53 @@
+"""JSON file helpers; reads use orjson when it is installed."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _to_builtin(obj: Any) -> Any:
+    """Convert NumPy scalars that json cannot serialize to Python values."""
+    return obj.item()
+
+
+def dump_json(obj: Any, path: Path) -> None:
+    """Write obj to path as indented JSON.
+
+    Always written with the stdlib so the files are the same whether or not
+    orjson is installed: orjson writes NaN/inf as null and formats small
+    floats differently. NaN is written as the stdlib's NaN token.
+    """
+    with open(path, "w") as f:
+        json.dump(obj, f, indent=2, default=_to_builtin)
+
+
+def dumps_canonical(obj: Any) -> bytes:
+    """Serialize obj to compact JSON with sorted keys, for hashing.
+
+    Uses the stdlib for the same reason as dump_json, so digests do not
+    depend on whether orjson is installed.
+    """
+    return json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), default=_to_builtin
+    ).encode()
+
+
+def load_json(path: Path) -> Any:
+    """Read JSON from path.
+
+    orjson rejects the NaN token the stdlib writes, so such files are
+    parsed with the stdlib instead.
+    """
+    if orjson is not None:
+        data = path.read_bytes()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+    with open(path, "r") as f:
+        return json.load(f)
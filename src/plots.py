@@ -1,16 +1,72 @@
 """Plotting functions for scatter and binscatter plots."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
+import matplotlib
+
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
 from PIL import Image
 
 from .analysis import RegressionResult
 
+plt.rcParams["path.simplify"] = True
+plt.rcParams["agg.path.chunksize"] = 10000
 
-def make_scatter_plot(
+_FIG: Optional[Figure] = None
+_AX: Optional[Axes] = None
+
+
+def _get_axes() -> tuple[Figure, Axes]:
+    """Return the shared plotting figure and axes, cleared for a new plot.
+
+    All plots use the same size, so one figure is created lazily and reused
+    to avoid repeated figure and font setup.
+    """
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG, _AX = plt.subplots(figsize=(6.6, 5.0))
+    else:
+        _AX.cla()
+    return _FIG, _AX
+
+
+def _regression_grid(x: np.ndarray) -> np.ndarray:
+    """Evenly spaced points spanning x, for drawing the fitted line."""
+    return np.linspace(np.nanmin(x), np.nanmax(x), 200)
+
+
+def _save_figure(fig: Figure, output_path: str, dpi: int) -> tuple[Path, np.ndarray]:
+    """Render fig once at dpi, write it as PNG, and return the path and pixels.
+
+    The RGBA buffer is returned so combined figures can be stitched without
+    re-reading the PNGs from disk. The figure's own dpi is restored after
+    drawing so the shared figure lays out the next plot as before.
+    """
+    original_dpi = fig.get_dpi()
+    fig.set_dpi(dpi)
+    try:
+        fig.canvas.draw()
+        image = np.array(fig.canvas.buffer_rgba())
+    finally:
+        fig.set_dpi(original_dpi)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    imsave(output_path, image, dpi=dpi)
+    return output_path, image
+
+
+def _render_scatter_plot(
     x: np.ndarray,
     y: np.ndarray,
     result: RegressionResult,
@@ -18,26 +74,15 @@ def make_scatter_plot(
     ylabel: str,
     output_path: str,
     dpi: int = 200,
-) -> Path:
-    """Create scatter plot with regression line and statistics.
-
-    Args:
-        x: Independent variable values
-        y: Dependent variable values
-        result: RegressionResult with coefficients and statistics
-        title: Plot title
-        ylabel: Y-axis label
-        output_path: Path to save the plot
-        dpi: Output resolution
-
-    Returns:
-        Path to saved plot
-    """
-    fig, ax = plt.subplots(figsize=(6.6, 5.0))
+    xs: Optional[np.ndarray] = None,
+) -> tuple[Path, np.ndarray]:
+    """Draw and save a scatter plot, returning its path and RGBA pixels."""
+    fig, ax = _get_axes()
 
     ax.scatter(x, y, alpha=0.7)
 
-    xs = np.linspace(np.nanmin(x), np.nanmax(x), 200)
+    if xs is None:
+        xs = _regression_grid(x)
     ax.plot(xs, result.intercept + result.slope * xs, linewidth=2, color="red")
 
     ax.axhline(0, linewidth=1, color="black")
@@ -63,13 +108,38 @@ def make_scatter_plot(
         bbox=dict(boxstyle="round", facecolor="white", alpha=0.85),
     )
 
-    plt.tight_layout()
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=dpi)
-    plt.close(fig)
+    fig.tight_layout()
+    return _save_figure(fig, output_path, dpi)
 
-    return output_path
+
+def make_scatter_plot(
+    x: np.ndarray,
+    y: np.ndarray,
+    result: RegressionResult,
+    title: str,
+    ylabel: str,
+    output_path: str,
+    dpi: int = 200,
+    xs: Optional[np.ndarray] = None,
+) -> Path:
+    """Create scatter plot with regression line and statistics.
+
+    Args:
+        x: Independent variable values
+        y: Dependent variable values
+        result: RegressionResult with coefficients and statistics
+        title: Plot title
+        ylabel: Y-axis label
+        output_path: Path to save the plot
+        dpi: Output resolution
+        xs: Grid for the regression line (default: 200 points spanning x)
+
+    Returns:
+        Path to saved plot
+    """
+    return _render_scatter_plot(
+        x, y, result, title, ylabel, output_path, dpi, xs
+    )[0]
 
 
 def compute_binscatter_data(
@@ -97,24 +167,30 @@ def compute_binscatter_data(
     bin_indices = np.digitize(x, bin_edges) - 1
     bin_indices = np.clip(bin_indices, 0, n_bins - 1)
 
+    counts = np.bincount(bin_indices, minlength=n_bins)
+    nonempty = counts > 0
+    multiple = counts > 1
+
     bin_means_x = np.zeros(n_bins)
     bin_means_y = np.zeros(n_bins)
     bin_se_y = np.zeros(n_bins)
 
-    for i in range(n_bins):
-        mask = bin_indices == i
-        if mask.sum() > 0:
-            bin_means_x[i] = np.mean(x[mask])
-            bin_means_y[i] = np.mean(y[mask])
-            if mask.sum() > 1:
-                bin_se_y[i] = np.std(y[mask], ddof=1) / np.sqrt(mask.sum())
-            else:
-                bin_se_y[i] = 0
+    sum_x = np.bincount(bin_indices, weights=x, minlength=n_bins)
+    sum_y = np.bincount(bin_indices, weights=y, minlength=n_bins)
+    np.divide(sum_x, counts, out=bin_means_x, where=nonempty)
+    np.divide(sum_y, counts, out=bin_means_y, where=nonempty)
+
+    # Sum of squared deviations from each bin mean (more stable than sum of y^2)
+    dev_y = y - bin_means_y[bin_indices]
+    ss_y = np.bincount(bin_indices, weights=dev_y * dev_y, minlength=n_bins)
+    bin_se_y[multiple] = np.sqrt(
+        ss_y[multiple] / (counts[multiple] - 1) / counts[multiple]
+    )
 
     return bin_means_x, bin_means_y, bin_se_y
 
 
-def make_binscatter_plot(
+def _render_binscatter_plot(
     x: np.ndarray,
     y: np.ndarray,
     result: RegressionResult,
@@ -123,25 +199,12 @@ def make_binscatter_plot(
     output_path: str,
     n_bins: int = 20,
     dpi: int = 200,
-) -> tuple[Path, pd.DataFrame]:
-    """Create binscatter plot with error bars and regression line.
-
-    Args:
-        x: Independent variable values
-        y: Dependent variable values
-        result: RegressionResult with coefficients and statistics
-        title: Plot title
-        ylabel: Y-axis label
-        output_path: Path to save the plot
-        n_bins: Number of quantile bins
-        dpi: Output resolution
-
-    Returns:
-        Tuple of (plot_path, binscatter_data_df)
-    """
+    xs: Optional[np.ndarray] = None,
+) -> tuple[Path, pd.DataFrame, np.ndarray]:
+    """Draw and save a binscatter plot, returning its path, bins and RGBA pixels."""
     bin_means_x, bin_means_y, bin_se_y = compute_binscatter_data(x, y, n_bins)
 
-    fig, ax = plt.subplots(figsize=(6.6, 5.0))
+    fig, ax = _get_axes()
 
     ax.errorbar(
         bin_means_x,
@@ -152,7 +215,8 @@ def make_binscatter_plot(
         alpha=0.7,
     )
 
-    xs = np.linspace(np.nanmin(x), np.nanmax(x), 200)
+    if xs is None:
+        xs = _regression_grid(x)
     ax.plot(xs, result.intercept + result.slope * xs, linewidth=2, color="red")
 
     ax.axhline(0, linewidth=1, color="black")
@@ -178,11 +242,8 @@ def make_binscatter_plot(
         bbox=dict(boxstyle="round", facecolor="white", alpha=0.85),
     )
 
-    plt.tight_layout()
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=dpi)
-    plt.close(fig)
+    fig.tight_layout()
+    output_path, image = _save_figure(fig, output_path, dpi)
 
     binscatter_df = pd.DataFrame(
         {
@@ -192,23 +253,67 @@ def make_binscatter_plot(
         }
     )
 
-    return output_path, binscatter_df
+    return output_path, binscatter_df, image
+
+
+def make_binscatter_plot(
+    x: np.ndarray,
+    y: np.ndarray,
+    result: RegressionResult,
+    title: str,
+    ylabel: str,
+    output_path: str,
+    n_bins: int = 20,
+    dpi: int = 200,
+    xs: Optional[np.ndarray] = None,
+) -> tuple[Path, pd.DataFrame]:
+    """Create binscatter plot with error bars and regression line.
+
+    Args:
+        x: Independent variable values
+        y: Dependent variable values
+        result: RegressionResult with coefficients and statistics
+        title: Plot title
+        ylabel: Y-axis label
+        output_path: Path to save the plot
+        n_bins: Number of quantile bins
+        dpi: Output resolution
+        xs: Grid for the regression line (default: 200 points spanning x)
+
+    Returns:
+        Tuple of (plot_path, binscatter_data_df)
+    """
+    plot_path, binscatter_df, _ = _render_binscatter_plot(
+        x, y, result, title, ylabel, output_path, n_bins, dpi, xs
+    )
+    return plot_path, binscatter_df
+
+
+def _load_image(source: Union[Path, np.ndarray]) -> Image.Image:
+    """Wrap a pixel array as an image, or open an image file and decode it."""
+    if isinstance(source, np.ndarray):
+        return Image.fromarray(source)
+    img = Image.open(source)
+    img.load()
+    return img
 
 
 def stitch_images_side_by_side(
-    image_paths: list[Path],
+    image_paths: list[Union[Path, np.ndarray]],
     output_path: str,
 ) -> Path:
     """Stitch multiple images side by side using PIL.
 
     Args:
-        image_paths: List of paths to images
+        image_paths: List of image paths or RGB(A) pixel arrays; arrays skip
+            the PNG decode
         output_path: Path to save stitched image
 
     Returns:
         Path to saved stitched image
     """
-    images = [Image.open(p) for p in image_paths]
+    with ThreadPoolExecutor(max_workers=len(image_paths)) as executor:
+        images = list(executor.map(_load_image, image_paths))
 
     total_width = sum(img.width for img in images)
     max_height = max(img.height for img in images)
@@ -238,6 +343,10 @@ def create_all_plots(
 ) -> dict[str, Path]:
     """Create all plots for the analysis.
 
+    The four figures are independent, so they are rendered in parallel
+    worker processes (capped at the CPU count; in-process on a single CPU)
+    before the combined figures are stitched.
+
     Args:
         df: Analysis DataFrame
         results: Dictionary of RegressionResults
@@ -248,58 +357,89 @@ def create_all_plots(
         Dictionary mapping plot names to paths
     """
     x = df["prod_yoy_pct"].values
+    profit_y = df["d_profit_share_yoy_pp"].values
+    wage_y = df["d_wage_share_yoy_pp"].values
+    profit_title = "Delta Profit Share (y/y, pp) vs Productivity Growth (y/y, %)"
+    profit_ylabel = "Delta Profit share (pp vs year ago)"
+    wage_title = "Delta Wage Share (y/y, pp) vs Productivity Growth (y/y, %)"
+    wage_ylabel = "Delta Wage share (pp vs year ago)"
+    xs = _regression_grid(x)
     output_paths = {}
 
-    profit_scatter = make_scatter_plot(
-        x,
-        df["d_profit_share_yoy_pp"].values,
-        results["profit"],
-        "Delta Profit Share (y/y, pp) vs Productivity Growth (y/y, %)",
-        "Delta Profit share (pp vs year ago)",
-        f"{figures_dir}/scatter_profit_share.png",
-    )
-    output_paths["scatter_profit"] = profit_scatter
+    jobs = [
+        (
+            _render_scatter_plot,
+            results["profit"],
+            profit_y,
+            profit_title,
+            profit_ylabel,
+            "scatter_profit_share.png",
+        ),
+        (
+            _render_scatter_plot,
+            results["wage"],
+            wage_y,
+            wage_title,
+            wage_ylabel,
+            "scatter_wage_share.png",
+        ),
+        (
+            _render_binscatter_plot,
+            results["profit"],
+            profit_y,
+            profit_title,
+            profit_ylabel,
+            "binscatter_profit_share.png",
+        ),
+        (
+            _render_binscatter_plot,
+            results["wage"],
+            wage_y,
+            wage_title,
+            wage_ylabel,
+            "binscatter_wage_share.png",
+        ),
+    ]
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    if max_workers == 1:
+        outputs = [
+            render(x, y, result, title, ylabel, f"{figures_dir}/{name}", xs=xs)
+            for render, result, y, title, ylabel, name in jobs
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    render, x, y, result, title, ylabel, f"{figures_dir}/{name}", xs=xs
+                )
+                for render, result, y, title, ylabel, name in jobs
+            ]
+            outputs = [future.result() for future in futures]
+
+    (
+        (profit_scatter, profit_scatter_image),
+        (wage_scatter, wage_scatter_image),
+        (profit_binscatter, profit_bins_df, profit_binscatter_image),
+        (wage_binscatter, wage_bins_df, wage_binscatter_image),
+    ) = outputs
 
-    wage_scatter = make_scatter_plot(
-        x,
-        df["d_wage_share_yoy_pp"].values,
-        results["wage"],
-        "Delta Wage Share (y/y, pp) vs Productivity Growth (y/y, %)",
-        "Delta Wage share (pp vs year ago)",
-        f"{figures_dir}/scatter_wage_share.png",
-    )
+    output_paths["scatter_profit"] = profit_scatter
     output_paths["scatter_wage"] = wage_scatter
 
     combined_scatter = stitch_images_side_by_side(
-        [profit_scatter, wage_scatter],
+        [profit_scatter_image, wage_scatter_image],
         f"{figures_dir}/scatter_combined.png",
     )
     output_paths["scatter_combined"] = combined_scatter
 
-    profit_binscatter, profit_bins_df = make_binscatter_plot(
-        x,
-        df["d_profit_share_yoy_pp"].values,
-        results["profit"],
-        "Delta Profit Share (y/y, pp) vs Productivity Growth (y/y, %)",
-        "Delta Profit share (pp vs year ago)",
-        f"{figures_dir}/binscatter_profit_share.png",
-    )
     output_paths["binscatter_profit"] = profit_binscatter
     profit_bins_df.to_csv(f"{processed_dir}/binscatter_profit.csv", index=False)
 
-    wage_binscatter, wage_bins_df = make_binscatter_plot(
-        x,
-        df["d_wage_share_yoy_pp"].values,
-        results["wage"],
-        "Delta Wage Share (y/y, pp) vs Productivity Growth (y/y, %)",
-        "Delta Wage share (pp vs year ago)",
-        f"{figures_dir}/binscatter_wage_share.png",
-    )
     output_paths["binscatter_wage"] = wage_binscatter
     wage_bins_df.to_csv(f"{processed_dir}/binscatter_wage.csv", index=False)
 
     combined_binscatter = stitch_images_side_by_side(
-        [profit_binscatter, wage_binscatter],
+        [profit_binscatter_image, wage_binscatter_image],
         f"{figures_dir}/binscatter_combined.png",
     )
     output_paths["binscatter_combined"] = combined_binscatter
@@ -1,14 +1,76 @@
 """Stationarity tests for time series variables."""
 
-import json
-from dataclasses import asdict, dataclass
+import csv
+import dataclasses
+import hashlib
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
-from statsmodels.tsa.stattools import adfuller, kpss
-
-
-@dataclass
+import pyarrow as pa
+import pyarrow.parquet as pq
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.linalg import solve_triangular
+from scipy.special import ndtr
+from statsmodels.tsa.adfvalues import mackinnoncrit, mackinnonp
+from statsmodels.tools.sm_exceptions import InterpolationWarning
+from statsmodels.tsa.stattools import kpss
+
+from .json_io import dump_json, dumps_canonical
+
+# Test results memoized by (content digest, length) of the NaN-free input,
+# plus the bandwidth for KPSS
+_ADF_CACHE: dict[tuple[str, int], tuple[float, float, float, float]] = {}
+_KPSS_CACHE: dict[tuple[str, int, Union[str, int]], tuple[float, float, float]] = {}
+
+# Below this many observations across pending series, starting a process
+# pool (~25 ms) costs more than running the tests in-process
+_POOL_MIN_OBS = 20_000
+
+# KPSS p-values are interpolated from a table and clipped at its bounds; the
+# clipped value is what we report, so the warning is noise
+warnings.filterwarnings(
+    "ignore", message="The test statistic is outside.*", module="statsmodels.*"
+)
+warnings.filterwarnings("ignore", category=InterpolationWarning)
+# statsmodels warns that kpss will return a result object in a future
+# release; we only read the tuple fields. The warning is raised with
+# stacklevel=2, so it is attributed to this module rather than to
+# statsmodels.tsa.stattools
+warnings.filterwarnings(
+    "ignore",
+    message="kpss currently returns a plain tuple",
+    category=FutureWarning,
+    module=__name__,
+)
+
+# MacKinnon (1994) p-value surface for the constant-only, single-series ADF,
+# read out of the statsmodels tables once (coefficients highest power first).
+# The tables are private to statsmodels, so fall back to mackinnonp if they
+# move or change shape
+try:
+    from statsmodels.tsa.adfvalues import (
+        _tau_largeps,
+        _tau_maxs,
+        _tau_mins,
+        _tau_smallps,
+        _tau_stars,
+    )
+
+    _TAU_MAX_C = _tau_maxs["c"][0]
+    _TAU_MIN_C = _tau_mins["c"][0]
+    _TAU_STAR_C = _tau_stars["c"][0]
+    _TAU_SMALLP_C = np.asarray(_tau_smallps["c"][0])[::-1]
+    _TAU_LARGEP_C = np.asarray(_tau_largeps["c"][0])[::-1]
+except (ImportError, KeyError, IndexError, TypeError):
+    _TAU_MAX_C = None
+
+
+@dataclasses.dataclass
 class StationarityResult:
     """Results from ADF and KPSS stationarity tests."""
 
@@ -23,49 +85,218 @@ class StationarityResult:
     is_stationary: bool
 
 
-def run_adf_test(series: pd.Series) -> tuple[float, float, float, float]:
+# Per-variable test statistics, one record per variable, in StationarityResult
+# field order
+_ADF_FIELDS = ["adf_stat", "adf_pvalue", "adf_critical_1pct", "adf_critical_5pct"]
+_KPSS_FIELDS = ["kpss_stat", "kpss_pvalue", "kpss_critical_5pct"]
+_RES_DT = np.dtype([(name, "f8") for name in _ADF_FIELDS + _KPSS_FIELDS])
+
+
+def clear_stationarity_cache() -> None:
+    """Forget all memoized ADF and KPSS results."""
+    _ADF_CACHE.clear()
+    _KPSS_CACHE.clear()
+
+
+def _array_key(arr: np.ndarray) -> tuple[str, int]:
+    """Cache key identifying an array by its contents."""
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+    return hashlib.blake2b(arr.tobytes(), digest_size=16).hexdigest(), arr.size
+
+
+def _fast_adf(x: np.ndarray) -> tuple[float, int]:
+    """ADF t-statistic with a constant and AIC lag selection.
+
+    Reproduces statsmodels' adfuller(x, regression="c", autolag="AIC").
+    Every candidate lag order is fit on the same maxlag-trimmed sample with
+    nested leading columns, so a single QR of the full design yields the SSR
+    of every candidate instead of one least-squares fit per lag.
+
+    Args:
+        x: NaN-free series
+
+    Returns:
+        Tuple of (adf_stat, nobs) where nobs is the size of the final
+        regression sample
+    """
+    if x.max() == x.min():
+        raise ValueError("Invalid input, x is constant")
+
+    nobs = x.shape[0]
+    maxlag = min(int(np.ceil(12.0 * (nobs / 100.0) ** 0.25)), nobs // 2 - 2)
+    if maxlag < 0:
+        raise ValueError(
+            "sample size is too short to use selected regression component"
+        )
+    dx = np.diff(x)
+
+    # Columns: constant, lagged level, then lagged differences 1..maxlag
+    windows = sliding_window_view(dx, maxlag + 1)
+    n = windows.shape[0]
+    X_full = np.column_stack([np.ones(n), x[maxlag:-1], windows[:, -2::-1]])
+    y = windows[:, -1]
+
+    Q, _ = np.linalg.qr(X_full)
+    qty = Q.T @ y
+    resid = y - Q @ qty
+    # SSR using the first j columns = full SSR + sum of qty[j:]**2
+    tail = np.append(np.cumsum(qty[::-1] ** 2)[::-1], 0.0)
+    ssr = resid @ resid + tail[2:]
+    n_cols = np.arange(2, X_full.shape[1] + 1)
+    aic = n * np.log(ssr / n) + 2 * n_cols
+    bestlag = int(np.argmin(aic))
+
+    # Refit with the selected lag on the longest available sample
+    windows = sliding_window_view(dx, bestlag + 1)
+    m = windows.shape[0]
+    X = np.column_stack([x[bestlag:-1], windows[:, -2::-1], np.ones(m)])
+    y = windows[:, -1]
+
+    Q, R = np.linalg.qr(X)
+    beta = solve_triangular(R, Q.T @ y)
+    resid = y - X @ beta
+    sigma2 = (resid @ resid) / (m - X.shape[1])
+    R_inv = solve_triangular(R, np.eye(X.shape[1]))
+    adf_stat = beta[0] / np.sqrt(sigma2 * (R_inv[0] @ R_inv[0]))
+    return float(adf_stat), m
+
+
+def _mackinnonp_c(adf_stat: float) -> float:
+    """MacKinnon approximate p-value; same as mackinnonp(stat, "c", N=1)."""
+    if _TAU_MAX_C is None:
+        return float(mackinnonp(adf_stat, regression="c", N=1))
+    if adf_stat > _TAU_MAX_C:
+        return 1.0
+    if adf_stat < _TAU_MIN_C:
+        return 0.0
+    coef = _TAU_SMALLP_C if adf_stat <= _TAU_STAR_C else _TAU_LARGEP_C
+    return float(ndtr(np.polyval(coef, adf_stat)))
+
+
+def _adf_worker(arr: np.ndarray) -> tuple[float, float, float, float]:
+    """Run the ADF test on a NaN-free array, uncached."""
+    adf_stat, nobs = _fast_adf(arr)
+    p_value = _mackinnonp_c(adf_stat)
+    critical_values = mackinnoncrit(N=1, regression="c", nobs=nobs)
+    return adf_stat, p_value, critical_values[0], critical_values[1]
+
+
+def _kpss_worker(
+    arr: np.ndarray, nlags: Union[str, int] = "auto"
+) -> tuple[float, float, float]:
+    """Run the KPSS test on a NaN-free array, uncached."""
+    result = kpss(arr, regression="c", nlags=nlags)
+    kpss_stat = result[0]
+    p_value = result[1]
+    critical_values = result[3]
+    return kpss_stat, p_value, critical_values["5%"]
+
+
+def run_adf_test(arr: np.ndarray) -> tuple[float, float, float, float]:
     """Run Augmented Dickey-Fuller test.
 
     Null hypothesis: The series has a unit root (non-stationary).
     Reject null (p < 0.05) to conclude stationarity.
 
     Args:
-        series: Time series to test
+        arr: Time series to test, without missing values
 
     Returns:
         Tuple of (adf_stat, p_value, critical_1pct, critical_5pct)
     """
-    result = adfuller(series.dropna(), autolag="AIC")
-    adf_stat = result[0]
-    p_value = result[1]
-    critical_values = result[4]
-    return adf_stat, p_value, critical_values["1%"], critical_values["5%"]
+    key = _array_key(arr)
+    if key not in _ADF_CACHE:
+        _ADF_CACHE[key] = _adf_worker(arr)
+    return _ADF_CACHE[key]
 
 
-def run_kpss_test(series: pd.Series) -> tuple[float, float, float]:
+def run_kpss_test(
+    arr: np.ndarray, nlags: Union[str, int] = "auto"
+) -> tuple[float, float, float]:
     """Run KPSS test.
 
     Null hypothesis: The series is stationary.
     Fail to reject null (p > 0.05) to conclude stationarity.
 
     Args:
-        series: Time series to test
+        arr: Time series to test, without missing values
+        nlags: Newey-West bandwidth, or "auto" for statsmodels' data-dependent
+            selection
 
     Returns:
         Tuple of (kpss_stat, p_value, critical_5pct)
     """
-    import warnings
+    key = (*_array_key(arr), nlags)
+    if key not in _KPSS_CACHE:
+        _KPSS_CACHE[key] = _kpss_worker(arr, nlags)
+    return _KPSS_CACHE[key]
 
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        result = kpss(series.dropna(), regression="c", nlags="auto")
-    kpss_stat = result[0]
-    p_value = result[1]
-    critical_values = result[3]
-    return kpss_stat, p_value, critical_values["5%"]
 
+def _test_one(
+    arr: np.ndarray,
+    kpss_nlags: Union[str, int] = "auto",
+    run_adf: bool = True,
+    run_kpss: bool = True,
+) -> tuple[Optional[tuple[float, ...]], Optional[tuple[float, ...]]]:
+    """Run the requested tests back-to-back on one array (process pool entry point).
 
-def run_stationarity_tests(df: pd.DataFrame) -> dict[str, StationarityResult]:
+    Returns:
+        Tuple of (adf_result, kpss_result), with None for a skipped test
+    """
+    adf_result = _adf_worker(arr) if run_adf else None
+    kpss_result = _kpss_worker(arr, kpss_nlags) if run_kpss else None
+    return adf_result, kpss_result
+
+
+def _fill_caches(
+    arrays: list[np.ndarray],
+    keys: list[tuple],
+    kpss_keys: list[tuple],
+    kpss_nlags: Union[str, int],
+    adf_wanted: list[bool],
+    kpss_wanted: list[bool],
+) -> None:
+    """Run the wanted, uncached tests, one process pool task per variable.
+
+    Both tests take well under a millisecond on a few hundred observations,
+    far less than starting a pool, so small workloads run in-process.
+    """
+    pending = []
+    for i, (key, kpss_key) in enumerate(zip(keys, kpss_keys)):
+        run_adf = adf_wanted[i] and key not in _ADF_CACHE
+        run_kpss = kpss_wanted[i] and kpss_key not in _KPSS_CACHE
+        if run_adf or run_kpss:
+            pending.append((i, run_adf, run_kpss))
+    if not pending:
+        return
+
+    max_workers = min(len(pending), os.cpu_count() or 1)
+    total_obs = sum(arrays[i].size for i, _, _ in pending)
+    if max_workers == 1 or total_obs < _POOL_MIN_OBS:
+        outputs = [
+            _test_one(arrays[i], kpss_nlags, run_adf, run_kpss)
+            for i, run_adf, run_kpss in pending
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_test_one, arrays[i], kpss_nlags, run_adf, run_kpss)
+                for i, run_adf, run_kpss in pending
+            ]
+            outputs = [future.result() for future in futures]
+
+    for (i, _, _), (adf_result, kpss_result) in zip(pending, outputs):
+        if adf_result is not None:
+            _ADF_CACHE[keys[i]] = adf_result
+        if kpss_result is not None:
+            _KPSS_CACHE[kpss_keys[i]] = kpss_result
+
+
+def run_stationarity_tests(
+    df: pd.DataFrame,
+    kpss_nlags: Union[str, int] = "auto",
+    fast_screen: bool = False,
+) -> dict[str, StationarityResult]:
     """Run ADF and KPSS tests on key transformed variables.
 
     Tests the three main variables used in regressions:
@@ -79,63 +310,134 @@ def run_stationarity_tests(df: pd.DataFrame) -> dict[str, StationarityResult]:
 
     Args:
         df: DataFrame with the three variables
+        kpss_nlags: KPSS bandwidth shared by all variables. The default "auto"
+            selects a data-dependent bandwidth per series; pass an int (e.g.
+            ceil(12 * (n / 100) ** 0.25)) to skip that search when the series
+            share a sample length. A fixed bandwidth changes the statistics.
+        fast_screen: If True, run KPSS first and skip ADF for variables where
+            KPSS rejects stationarity (p <= 0.05). Those variables are marked
+            non-stationary and their ADF fields are NaN, so only use this when
+            the is_stationary flag is all that matters.
 
     Returns:
         Dictionary mapping variable names to StationarityResult
     """
     variables = ["prod_yoy_pct", "d_profit_share_yoy_pp", "d_wage_share_yoy_pp"]
-    results = {}
-
+    arrays = []
     for var in variables:
-        series = df[var]
-
-        adf_stat, adf_pvalue, adf_crit_1, adf_crit_5 = run_adf_test(series)
-        kpss_stat, kpss_pvalue, kpss_crit_5 = run_kpss_test(series)
-
-        # Stationary if ADF rejects (p < 0.05) AND KPSS fails to reject (p > 0.05)
-        is_stationary = bool((adf_pvalue < 0.05) and (kpss_pvalue > 0.05))
-
-        results[var] = StationarityResult(
-            variable=var,
-            adf_stat=adf_stat,
-            adf_pvalue=adf_pvalue,
-            adf_critical_1pct=adf_crit_1,
-            adf_critical_5pct=adf_crit_5,
-            kpss_stat=kpss_stat,
-            kpss_pvalue=kpss_pvalue,
-            kpss_critical_5pct=kpss_crit_5,
-            is_stationary=is_stationary,
-        )
-
-    return results
+        arr = df[var].to_numpy(dtype=np.float64)
+        arrays.append(arr[~np.isnan(arr)])
+    keys = [_array_key(arr) for arr in arrays]
+    kpss_keys = [(*key, kpss_nlags) for key in keys]
+
+    everything = [True] * len(variables)
+    if fast_screen:
+        nothing = [False] * len(variables)
+        _fill_caches(arrays, keys, kpss_keys, kpss_nlags, nothing, everything)
+        needs_adf = [_KPSS_CACHE[key][1] > 0.05 for key in kpss_keys]
+        _fill_caches(arrays, keys, kpss_keys, kpss_nlags, needs_adf, nothing)
+    else:
+        needs_adf = everything
+        _fill_caches(arrays, keys, kpss_keys, kpss_nlags, everything, everything)
+
+    out = np.full(len(variables), np.nan, dtype=_RES_DT)
+    for i, (key, kpss_key, adf_run) in enumerate(zip(keys, kpss_keys, needs_adf)):
+        if adf_run:
+            out[_ADF_FIELDS][i] = _ADF_CACHE[key]
+        out[_KPSS_FIELDS][i] = _KPSS_CACHE[kpss_key]
+
+    # Stationary if ADF rejects (p < 0.05) AND KPSS fails to reject (p > 0.05)
+    is_stationary = (out["adf_pvalue"] < 0.05) & (out["kpss_pvalue"] > 0.05)
+
+    return {
+        var: StationarityResult(var, *row.item(), is_stationary=bool(flag))
+        for var, row, flag in zip(variables, out, is_stationary)
+    }
 
 
 def export_stationarity_results(
     results: dict[str, StationarityResult],
     output_dir: str = "results",
-) -> tuple[Path, Path]:
-    """Export stationarity test results to JSON and CSV.
+    force: bool = False,
+) -> tuple[Path, Path, Path]:
+    """Export stationarity test results to JSON, CSV and Parquet.
+
+    Parquet keeps column dtypes and loads fastest, so prefer it for
+    downstream analysis; the CSV is meant for human inspection.
+
+    A digest of the results is kept in stationarity_tests.sha; when it matches
+    and all outputs exist, nothing is rewritten.
 
     Args:
         results: Dictionary of StationarityResult
         output_dir: Directory for output files
+        force: If True, rewrite the outputs even if the results are unchanged
 
     Returns:
-        Tuple of (json_path, csv_path)
+        Tuple of (json_path, csv_path, parquet_path)
     """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Export to JSON
-    results_dict = {k: asdict(v) for k, v in results.items()}
+    # vars() exposes each dataclass's __dict__ without copying; both writers
+    # only read the rows
+    rows = [vars(result) for result in results.values()]
+    results_dict = dict(zip(results.keys(), rows))
+
     json_path = output_path / "stationarity_tests.json"
-    with open(json_path, "w") as f:
-        json.dump(results_dict, f, indent=2)
+    csv_path = output_path / "stationarity_tests.csv"
+    parquet_path = output_path / "stationarity_tests.parquet"
+    hash_path = output_path / "stationarity_tests.sha"
+    digest = hashlib.blake2b(
+        dumps_canonical(results_dict), digest_size=16
+    ).hexdigest()
+    if (
+        not force
+        and hash_path.exists()
+        and hash_path.read_text() == digest
+        and all(p.exists() for p in (json_path, csv_path, parquet_path))
+    ):
+        return json_path, csv_path, parquet_path
+
+    # Export to JSON
+    dump_json(results_dict, json_path)
 
     # Export to CSV
-    rows = [asdict(result) for result in results.values()]
-    csv_df = pd.DataFrame(rows)
-    csv_path = output_path / "stationarity_tests.csv"
-    csv_df.to_csv(csv_path, index=False)
+    fieldnames = [field.name for field in dataclasses.fields(StationarityResult)]
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
+        writer.writeheader()
+        # Write NaN (fast_screen's skipped ADF fields) as an empty field,
+        # as DataFrame.to_csv does
+        writer.writerows(
+            {
+                key: "" if isinstance(value, float) and np.isnan(value) else value
+                for key, value in row.items()
+            }
+            for row in rows
+        )
+
+    # Export to Parquet
+    table = pa.Table.from_pylist(rows)
+    pq.write_table(table, parquet_path, compression="zstd")
+
+    # Written last so an interrupted export is redone on the next run
+    hash_path.write_text(digest)
 
-    return json_path, csv_path
+    return json_path, csv_path, parquet_path
+
+
+def load_stationarity_results(
+    output_dir: str = "results",
+) -> dict[str, StationarityResult]:
+    """Load stationarity results previously written by export_stationarity_results.
+
+    Args:
+        output_dir: Directory containing stationarity_tests.parquet
+
+    Returns:
+        Dictionary mapping variable names to StationarityResult
+    """
+    parquet_path = Path(output_dir) / "stationarity_tests.parquet"
+    rows = pq.read_table(parquet_path).to_pylist()
+    return {row["variable"]: StationarityResult(**row) for row in rows}
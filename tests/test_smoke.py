@@ -17,6 +17,21 @@ EXPECTED_COLUMNS = [
     "profit_share_pct",
 ]
 
+_DTYPES = {
+    "prod_yoy_pct": "float32",
+    "d_wage_share_yoy_pp": "float32",
+    "wage_share_pct": "float32",
+    "d_profit_share_yoy_pp": "float32",
+    "profit_share_pct": "float32",
+}
+
+
+def _read_dataset(path: Path) -> pd.DataFrame:
+    """Read an analysis CSV with known columns and dtypes."""
+    return pd.read_csv(
+        path, usecols=EXPECTED_COLUMNS, dtype=_DTYPES, parse_dates=["date"]
+    )
+
 
 class TestDatasetColumns:
     """Test that output dataset has expected columns."""
@@ -27,7 +42,7 @@ class TestDatasetColumns:
         if not sample_path.exists():
             pytest.skip("Sample CSV not found")
 
-        df = pd.read_csv(sample_path)
+        df = pd.read_csv(sample_path, nrows=0)
         for col in EXPECTED_COLUMNS:
             assert col in df.columns, f"Missing column: {col}"
 
@@ -37,7 +52,7 @@ class TestDatasetColumns:
         if not processed_path.exists():
             pytest.skip("Processed CSV not found - run pipeline first")
 
-        df = pd.read_csv(processed_path)
+        df = pd.read_csv(processed_path, nrows=0)
         for col in EXPECTED_COLUMNS:
             assert col in df.columns, f"Missing column: {col}"
 
@@ -51,7 +66,7 @@ class TestDataQuality:
         if not processed_path.exists():
             pytest.skip("Processed CSV not found - run pipeline first")
 
-        df = pd.read_csv(processed_path)
+        df = _read_dataset(processed_path)
         assert not df.isna().any().any(), "Found missing values in processed data"
 
     def test_quarterly_frequency(self):
@@ -60,8 +75,7 @@ class TestDataQuality:
         if not processed_path.exists():
             pytest.skip("Processed CSV not found - run pipeline first")
 
-        df = pd.read_csv(processed_path)
-        df["date"] = pd.to_datetime(df["date"])
+        df = _read_dataset(processed_path)
         df = df.sort_values("date")
 
         date_diff = df["date"].diff().dropna()
@@ -139,10 +153,10 @@ class TestTransformations:
 
         df = pd.DataFrame({
             "date": pd.date_range("2020-01-01", periods=8, freq="QE"),
-            "OPHNFB": [100, 101, 102, 103, 105, 106, 107, 108],
-            "GDP": [1000] * 8,
-            "CPROFIT": [100] * 8,
-            "COE": [500] * 8,
+            "OPHNFB": pd.Series([100, 101, 102, 103, 105, 106, 107, 108], dtype="float32"),
+            "GDP": pd.Series([1000] * 8, dtype="float32"),
+            "CPROFIT": pd.Series([100] * 8, dtype="float32"),
+            "COE": pd.Series([500] * 8, dtype="float32"),
         })
 
         result = compute_transformations(df)
@@ -157,10 +171,10 @@ class TestTransformations:
 
         df = pd.DataFrame({
             "date": pd.date_range("2020-01-01", periods=5, freq="QE"),
-            "OPHNFB": [100, 101, 102, 103, 104],
-            "GDP": [1000, 1000, 1000, 1000, 1000],
-            "CPROFIT": [100, 110, 120, 130, 140],
-            "COE": [500, 510, 520, 530, 540],
+            "OPHNFB": pd.Series([100, 101, 102, 103, 104], dtype="float32"),
+            "GDP": pd.Series([1000, 1000, 1000, 1000, 1000], dtype="float32"),
+            "CPROFIT": pd.Series([100, 110, 120, 130, 140], dtype="float32"),
+            "COE": pd.Series([500, 510, 520, 530, 540], dtype="float32"),
         })
 
         result = compute_transformations(df)
@@ -191,3 +205,368 @@ class TestRegression:
         assert result.r2 > 0.8
         assert result.n_obs == 100
         assert result.maxlags == 4
+
+    def test_fit_ols_hac_matches_statsmodels(self):
+        """Test closed-form HAC t-statistic against statsmodels."""
+        from src.analysis import fit_ols_hac
+        import numpy as np
+        import statsmodels.api as sm
+
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=200)
+        y = 1 + 0.3 * x + rng.normal(size=200)
+
+        result = fit_ols_hac(x, y, maxlags=4)
+        hac = sm.OLS(y, sm.add_constant(x)).fit(
+            cov_type="HAC", cov_kwds={"maxlags": 4}
+        )
+
+        assert abs(result.t_hac - hac.tvalues[1]) < 1e-8
+        assert abs(result.r2 - hac.rsquared) < 1e-10
+
+
+class TestJsonIO:
+    """Test JSON helpers."""
+
+    def test_dump_json_does_not_depend_on_orjson(self, monkeypatch):
+        """Check NaN and small floats are written the same with or without orjson."""
+        from src import json_io
+        import math
+        import numpy as np
+
+        obj = {"x": np.float64(4.339470343566164e-05), "nan": float("nan"), "n": 3}
+        with tempfile.TemporaryDirectory() as tmp:
+            with_orjson = Path(tmp, "a.json")
+            json_io.dump_json(obj, with_orjson)
+            monkeypatch.setattr(json_io, "orjson", None)
+            without_orjson = Path(tmp, "b.json")
+            json_io.dump_json(obj, without_orjson)
+
+            assert with_orjson.read_bytes() == without_orjson.read_bytes()
+            assert "NaN" in with_orjson.read_text()
+            monkeypatch.undo()
+            loaded = json_io.load_json(with_orjson)
+
+        assert loaded["x"] == obj["x"]
+        assert math.isnan(loaded["nan"])
+
+
+class TestFREDCache:
+    """Test FRED cache handling."""
+
+    def test_csv_cache_migrates_to_parquet(self):
+        """Check that a CSV cache is loaded and rewritten as Parquet."""
+        from src.fred_client import FREDClient
+
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "GDP.csv").write_text(
+                "date,GDP\n2020-01-01,100.0\n2020-04-01,\n"
+            )
+            client = FREDClient(cache_dir=tmp, no_network=True)
+
+            df = client.get_series("GDP")
+
+            assert Path(tmp, "GDP.parquet").exists()
+            assert pd.api.types.is_datetime64_any_dtype(df["date"])
+            pd.testing.assert_frame_equal(client.get_series("GDP"), df)
+
+    def test_updated_csv_cache_replaces_parquet(self):
+        """Check a CSV newer than its Parquet copy is reloaded."""
+        from src.fred_client import FREDClient
+
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp, "GDP.csv")
+            csv_path.write_text("date,GDP\n2020-01-01,100.0\n")
+            FREDClient(cache_dir=tmp, no_network=True).get_series("GDP")
+
+            csv_path.write_text("date,GDP\n2020-01-01,100.0\n2020-04-01,101.0\n")
+            parquet_mtime = Path(tmp, "GDP.parquet").stat().st_mtime
+            os.utime(csv_path, (parquet_mtime + 1, parquet_mtime + 1))
+            df = FREDClient(cache_dir=tmp, no_network=True).get_series("GDP")
+
+            assert df["GDP"].tolist() == [100.0, 101.0]
+
+    def test_validate_series_ignores_missing_dates(self, capsys):
+        """Check missing dates do not break the quarterly frequency check."""
+        from src.fred_client import FREDClient
+
+        with tempfile.TemporaryDirectory() as tmp:
+            client = FREDClient(cache_dir=tmp, no_network=True)
+        df = pd.DataFrame({
+            "date": pd.to_datetime(
+                ["2020-01-01", None, "2020-04-01", None, "2020-07-01"]
+            ),
+            "GDP": [1.0, 2.0, 3.0, 4.0, 5.0],
+        })
+
+        client.validate_series(df, "GDP")
+
+        assert "may not be quarterly" not in capsys.readouterr().out
+
+    def test_save_to_cache_keeps_csv_in_sync(self):
+        """Check fetched series are written to both the CSV and Parquet."""
+        from src.fred_client import FREDClient
+
+        with tempfile.TemporaryDirectory() as tmp:
+            client = FREDClient(cache_dir=tmp, no_network=True)
+            df = pd.DataFrame({
+                "date": pd.to_datetime(["2020-01-01", "2020-04-01"]),
+                "GDP": [100.0, 101.0],
+            })
+
+            client._save_to_cache("GDP", df)
+
+            pd.testing.assert_frame_equal(
+                pd.read_csv(Path(tmp, "GDP.csv"), parse_dates=["date"]), df
+            )
+            pd.testing.assert_frame_equal(client.get_series("GDP"), df)
+
+
+class TestBinscatter:
+    """Test binscatter computations."""
+
+    def test_compute_binscatter_data(self):
+        """Check bin means and standard errors against a direct computation."""
+        from src.plots import compute_binscatter_data
+        import numpy as np
+
+        rng = np.random.default_rng(1)
+        x = rng.normal(size=100)
+        y = 0.5 * x + rng.normal(size=100)
+
+        means_x, means_y, se_y = compute_binscatter_data(x, y, n_bins=10)
+
+        order = np.argsort(x)
+        for i, idx in enumerate(np.array_split(order, 10)):
+            assert abs(means_x[i] - x[idx].mean()) < 1e-12
+            assert abs(means_y[i] - y[idx].mean()) < 1e-12
+            expected_se = y[idx].std(ddof=1) / np.sqrt(len(idx))
+            assert abs(se_y[i] - expected_se) < 1e-12
+
+    def test_repeated_scatter_renders_are_identical(self):
+        """Check reusing the shared figure does not change later plots."""
+        from src.analysis import fit_ols_hac
+        from src.plots import make_scatter_plot
+        import numpy as np
+        from matplotlib.image import imread
+
+        rng = np.random.default_rng(5)
+        x = rng.normal(size=50)
+        y = 0.5 * x + rng.normal(size=50)
+        result = fit_ols_hac(x, y, maxlags=4, dependent_var="test")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            first = make_scatter_plot(x, y, result, "t", "y", Path(tmp, "a.png"))
+            second = make_scatter_plot(x, y, result, "t", "y", Path(tmp, "b.png"))
+
+            assert np.array_equal(imread(first), imread(second))
+
+
+class TestBuildDataset:
+    """Test dataset building."""
+
+    def test_build_analysis_dataset_is_memoized(self):
+        """Check repeated builds reuse the memoized dataset as a copy."""
+        from src.build_dataset import (
+            _cached_build_analysis_dataset,
+            build_analysis_dataset,
+        )
+        import shutil
+
+        raw_dir = Path("data/raw")
+        if not (raw_dir / "OPHNFB.csv").exists():
+            pytest.skip("Raw FRED cache not found")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp, "raw")
+            shutil.copytree(raw_dir, cache_dir)
+            kwargs = dict(
+                no_network=True,
+                cache_dir=str(cache_dir),
+                output_dir=str(Path(tmp, "processed")),
+            )
+
+            first = build_analysis_dataset(**kwargs)
+            first.loc[0, "prod_yoy_pct"] = 1e9
+            output_file = Path(tmp, "processed", "dshares_vs_prod.csv")
+            output_file.unlink()
+            hits = _cached_build_analysis_dataset.cache_info().hits
+            second = build_analysis_dataset(**kwargs)
+
+            assert _cached_build_analysis_dataset.cache_info().hits == hits + 1
+            assert second.loc[0, "prod_yoy_pct"] != 1e9
+            assert list(second.columns) == EXPECTED_COLUMNS
+            assert output_file.exists()
+
+
+class TestStationarity:
+    """Test stationarity helpers."""
+
+    def test_results_are_memoized_by_content(self):
+        """Check repeated tests on identical data reuse cached results."""
+        from src import stationarity
+        import numpy as np
+
+        stationarity.clear_stationarity_cache()
+        rng = np.random.default_rng(2)
+        arr = rng.normal(size=120)
+
+        first = stationarity.run_adf_test(arr)
+        second = stationarity.run_adf_test(arr.copy())
+
+        assert first == second
+        assert len(stationarity._ADF_CACHE) == 1
+        stationarity.clear_stationarity_cache()
+        assert not stationarity._ADF_CACHE
+
+    def test_fast_adf_matches_statsmodels(self):
+        """Check the vectorized ADF against statsmodels' adfuller."""
+        from src.stationarity import run_adf_test
+        import warnings
+        import numpy as np
+        from statsmodels.tsa.stattools import adfuller
+
+        rng = np.random.default_rng(3)
+        e = rng.normal(size=200)
+        x = np.zeros(200)
+        for t in range(1, 200):
+            x[t] = 0.8 * x[t - 1] + e[t] + 0.5 * e[t - 1]
+
+        adf_stat, p_value, crit_1, crit_5 = run_adf_test(x)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            expected = adfuller(x, autolag="AIC")
+
+        assert abs(adf_stat - expected[0]) < 1e-8
+        assert abs(p_value - expected[1]) < 1e-8
+        assert abs(crit_1 - expected[4]["1%"]) < 1e-8
+        assert abs(crit_5 - expected[4]["5%"]) < 1e-8
+
+    def test_mackinnon_pvalue_falls_back_to_statsmodels(self, monkeypatch):
+        """Check the p-value matches mackinnonp with and without the tables."""
+        from src import stationarity
+        from statsmodels.tsa.adfvalues import mackinnonp
+
+        stats = [-25.0, -4.0, -2.5, -1.0, 0.5, 5.0]
+        fast = [stationarity._mackinnonp_c(stat) for stat in stats]
+        monkeypatch.setattr(stationarity, "_TAU_MAX_C", None)
+        fallback = [stationarity._mackinnonp_c(stat) for stat in stats]
+
+        expected = [mackinnonp(stat, regression="c", N=1) for stat in stats]
+        assert fast == expected
+        assert fallback == expected
+
+    def test_load_stationarity_results(self):
+        """Check saved stationarity results load back without re-running tests."""
+        from src.stationarity import StationarityResult, load_stationarity_results
+
+        parquet_path = Path("results/stationarity_tests.parquet")
+        if not parquet_path.exists():
+            pytest.skip("Stationarity Parquet not found - run pipeline first")
+
+        results = load_stationarity_results("results")
+
+        assert set(results) == {
+            "prod_yoy_pct",
+            "d_profit_share_yoy_pp",
+            "d_wage_share_yoy_pp",
+        }
+        for var, result in results.items():
+            assert isinstance(result, StationarityResult)
+            assert result.variable == var
+            assert isinstance(result.is_stationary, bool)
+
+    def test_export_skips_unchanged_results(self):
+        """Check re-exporting identical results leaves the files untouched."""
+        from src.json_io import load_json
+        from src.stationarity import StationarityResult, export_stationarity_results
+
+        result = StationarityResult(
+            "prod_yoy_pct", -3.2, 0.02, -3.5, -2.9, 0.35, 0.1, 0.46, True
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = export_stationarity_results({"prod_yoy_pct": result}, tmp)
+            for path in paths:
+                os.utime(path, ns=(0, 0))
+
+            export_stationarity_results({"prod_yoy_pct": result}, tmp)
+            assert all(path.stat().st_mtime_ns == 0 for path in paths)
+
+            export_stationarity_results({"prod_yoy_pct": result}, tmp, force=True)
+            assert all(path.stat().st_mtime_ns > 0 for path in paths)
+
+            result.kpss_pvalue = 0.04
+            export_stationarity_results({"prod_yoy_pct": result}, tmp)
+            assert load_json(paths[0])["prod_yoy_pct"]["kpss_pvalue"] == 0.04
+
+    def test_small_inputs_run_without_process_pool(self, monkeypatch):
+        """Check short series are tested in-process rather than in a pool."""
+        from src import stationarity
+        import numpy as np
+        import pandas as pd
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started for a small workload")
+
+        monkeypatch.setattr(stationarity, "ProcessPoolExecutor", no_pool)
+        monkeypatch.setattr(stationarity.os, "cpu_count", lambda: 4)
+        stationarity.clear_stationarity_cache()
+        rng = np.random.default_rng(6)
+        df = pd.DataFrame({
+            "prod_yoy_pct": rng.normal(size=120),
+            "d_profit_share_yoy_pp": rng.normal(size=120),
+            "d_wage_share_yoy_pp": rng.normal(size=120),
+        })
+
+        results = stationarity.run_stationarity_tests(df)
+
+        assert len(results) == 3
+        assert len(stationarity._ADF_CACHE) == 3
+        stationarity.clear_stationarity_cache()
+
+    def test_export_writes_nan_adf_fields_as_nan(self):
+        """Check screened-out ADF fields stay NaN in JSON and empty in CSV."""
+        from src.json_io import load_json
+        from src.stationarity import StationarityResult, export_stationarity_results
+        import math
+
+        nan = float("nan")
+        result = StationarityResult(
+            "d_wage_share_yoy_pp", nan, nan, nan, nan, 0.9, 0.01, 0.46, False
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path, _, _ = export_stationarity_results(
+                {"d_wage_share_yoy_pp": result}, tmp
+            )
+            text = json_path.read_text()
+            loaded = load_json(json_path)["d_wage_share_yoy_pp"]
+            csv_text = Path(tmp, "stationarity_tests.csv").read_text()
+
+        expected_csv = pd.DataFrame([vars(result)]).to_csv(index=False)
+        assert csv_text == expected_csv
+
+        assert "null" not in text
+        assert math.isnan(loaded["adf_stat"])
+
+    def test_fast_screen_skips_adf_when_kpss_rejects(self):
+        """Check fast_screen leaves ADF fields NaN for KPSS-rejected series."""
+        from src import stationarity
+        import numpy as np
+        import pandas as pd
+
+        stationarity.clear_stationarity_cache()
+        rng = np.random.default_rng(4)
+        df = pd.DataFrame({
+            "prod_yoy_pct": rng.normal(size=120),
+            "d_profit_share_yoy_pp": rng.normal(size=120),
+            "d_wage_share_yoy_pp": np.cumsum(rng.normal(size=120)),
+        })
+
+        results = stationarity.run_stationarity_tests(df, fast_screen=True)
+
+        walk = results["d_wage_share_yoy_pp"]
+        assert walk.kpss_pvalue <= 0.05
+        assert np.isnan(walk.adf_pvalue)
+        assert not walk.is_stationary
+        assert len(stationarity._ADF_CACHE) == 2
+        stationarity.clear_stationarity_cache()